@@ -9,21 +9,48 @@ and comparison utilities for Article 4.
 
 import numpy as np
 
+# --- Sorted Counting Helper ---
+
+def _count_at_most(values, T, assume_sorted=False):
+    """
+    Count entries of values that are <= T.
+    
+    With assume_sorted=True the values must already be in ascending order
+    (NaNs last, as np.sort leaves them) and each threshold costs one
+    O(log N) binary search. Otherwise a scalar T is counted with a single
+    O(N) comparison, and an array of thresholds sorts the values once
+    before searching.
+    
+    Parameters:
+        values (array-like): sequence of values
+        T (float or array-like): threshold(s)
+        assume_sorted (bool): whether values are already sorted
+    
+    Returns:
+        int or np.ndarray: count(s) of values below threshold(s)
+    """
+    values = np.asarray(values).ravel()
+    if not assume_sorted:
+        if np.ndim(T) == 0:
+            return np.sum(values <= T)
+        values = np.sort(values)
+    return np.searchsorted(values, T, side="right")
+
 # --- Spectral Counting ---
 
-def spectral_counting(lambdas, T):
+def spectral_counting(lambdas, T, assume_sorted=False):
     """
     Count number of eigenvalues λ_n <= T.
     
     Parameters:
         lambdas (array-like): eigenvalues λ_n
-        T (float): threshold
+        T (float or array-like): threshold(s)
+        assume_sorted (bool): skip sorting for ascending input
     
     Returns:
-        int: count of eigenvalues below threshold
+        int or np.ndarray: count of eigenvalues below each threshold
     """
-    lambdas = np.array(lambdas)
-    return np.sum(lambdas <= T)
+    return _count_at_most(lambdas, T, assume_sorted)
 
 def spectral_asymptotics(T):
     """
@@ -40,19 +67,19 @@ def spectral_asymptotics(T):
 
 # --- Zeta Zero Counting ---
 
-def zeta_counting(gammas, T):
+def zeta_counting(gammas, T, assume_sorted=False):
     """
     Count number of zeta zeros γ_n <= T.
     
     Parameters:
         gammas (array-like): ordinates of zeta zeros
-        T (float): threshold
+        T (float or array-like): threshold(s)
+        assume_sorted (bool): skip sorting for ascending input
     
     Returns:
-        int: count of zeros below threshold
+        int or np.ndarray: count of zeros below each threshold
     """
-    gammas = np.array(gammas)
-    return np.sum(gammas <= T)
+    return _count_at_most(gammas, T, assume_sorted)
 
 def riemann_von_mangoldt(T):
     """
@@ -69,20 +96,23 @@ def riemann_von_mangoldt(T):
 
 # --- Comparison Utilities ---
 
-def compare_counts(lambdas, gammas, T):
+def compare_counts(lambdas, gammas, T, assume_sorted=False):
     """
     Compare spectral and zeta zero counts up to threshold T.
+    Passing an array of thresholds returns per-threshold count arrays,
+    which avoids calling this function in a loop to tabulate N(T).
     
     Parameters:
         lambdas (array-like): eigenvalues λ_n
         gammas (array-like): zeta zeros γ_n
-        T (float): threshold
+        T (float or array-like): threshold(s)
+        assume_sorted (bool): skip sorting when both inputs are ascending
     
     Returns:
         dict: containing counts and difference
     """
-    spec_count = spectral_counting(lambdas, T)
-    zeta_count = zeta_counting(gammas, T)
+    spec_count = spectral_counting(lambdas, T, assume_sorted)
+    zeta_count = zeta_counting(gammas, T, assume_sorted)
     return {
         "spectral_count": spec_count,
         "zeta_count": zeta_count,
@@ -102,5 +132,7 @@ if __name__ == "__main__":
     print("Spectral count up to T:", spectral_counting(lambdas, T))
     print("Zeta count up to T:", zeta_counting(gammas, T))
     print("Comparison:", compare_counts(lambdas, gammas, T))
+    print("Comparison over T = 10..50:",
+          compare_counts(lambdas, gammas, np.arange(10, 51, 10), assume_sorted=True))
     print("Spectral asymptotics:", spectral_asymptotics(T))
     print("Riemann–von Mangoldt:", riemann_von_mangoldt(T))
@@ -23,7 +23,9 @@ def exponential_kernel(lambda_array, t):
     Returns:
         np.ndarray: Kernel values
     """
-    return np.exp(t * np.array(lambda_array))
+    lambda_array = np.asarray(lambda_array)
+    values = np.multiply(t, lambda_array, dtype=np.result_type(t, lambda_array, np.float64))
+    return np.exp(values, out=values)
 
 def gaussian_kernel(lambda_array, t, sigma=1.0):
     """
@@ -38,8 +40,12 @@ def gaussian_kernel(lambda_array, t, sigma=1.0):
     Returns:
         np.ndarray: Smoothed kernel values
     """
-    lambda_array = np.array(lambda_array)
-    return np.exp(- (t - lambda_array)**2 / (2 * sigma**2))
+    lambda_array = np.asarray(lambda_array)
+    # Build the exponent in a single buffer instead of one temporary per operation
+    values = np.subtract(t, lambda_array, dtype=np.result_type(t, lambda_array, np.float64))
+    np.square(values, out=values)
+    values /= -2.0 * sigma**2
+    return np.exp(values, out=values)
 
 def sinc_kernel(lambda_array, t, scale=1.0):
     """
@@ -54,8 +60,11 @@ def sinc_kernel(lambda_array, t, scale=1.0):
     Returns:
         np.ndarray: Sinc kernel values
     """
-    lambda_array = np.array(lambda_array)
-    return np.sinc(scale * (t - lambda_array))
+    lambda_array = np.asarray(lambda_array)
+    # sin(πx) / (πx), with the removable singularity at x = 0 set to 1
+    px = np.subtract(t, lambda_array, dtype=np.result_type(t, lambda_array, np.float64))
+    px *= np.pi * scale
+    return np.divide(np.sin(px), px, out=np.ones_like(px), where=px != 0)
 
 # --- Trace and Spacing Utilities ---
 
@@ -71,18 +80,20 @@ def trace_sum(kernel_values):
     """
     return np.sum(kernel_values)
 
-def spacing(array):
+def spacing(array, out=None):
     """
     Compute spacing between consecutive values
 
     Parameters:
         array (array-like): Sequence of values
+        out (np.ndarray): Optional preallocated buffer for the result,
+            reused across calls to avoid a new allocation each time
 
     Returns:
         np.ndarray: Differences between consecutive entries
     """
-    array = np.array(array)
-    return np.diff(array)
+    array = np.asarray(array)
+    return np.subtract(array[..., 1:], array[..., :-1], out=out)
 
 # --- Error Analysis ---
 
@@ -97,11 +108,14 @@ def absolute_error(approx, exact):
     Returns:
         np.ndarray: Absolute errors
     """
-    return np.abs(np.array(approx) - np.array(exact))
+    approx = np.asarray(approx)
+    exact = np.asarray(exact)
+    return np.abs(approx - exact)
 
 def relative_error(approx, exact):
     """
     Compute relative error between two arrays
+    Entries where the reference value is zero are reported as 0.
 
     Parameters:
         approx (array-like): Approximated values
@@ -110,6 +124,9 @@ def relative_error(approx, exact):
     Returns:
         np.ndarray: Relative errors
     """
-    approx = np.array(approx)
-    exact = np.array(exact)
-    return np.abs(approx - exact) / np.abs(exact)
+    approx = np.asarray(approx)
+    exact = np.asarray(exact)
+    num = np.abs(approx - exact)
+    den = np.abs(exact)
+    return np.divide(num, den, out=np.zeros_like(num, dtype=np.result_type(num, np.float64)),
+                     where=den != 0)
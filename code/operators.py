@@ -38,21 +38,25 @@ class ScalingOperator:
         Returns:
             np.ndarray: array of normalized values
         """
-        lambdas = self.eigenvalues(N)
-        return 0.5 * lambdas + 10
+        # Equivalent to 0.5 * eigenvalues(N) + 10, built in a single buffer
+        values = np.arange(1, N+1, dtype=np.float64)
+        values *= 0.5 * self.alpha
+        values += 10
+        return values
 
 # --- Utility Functions ---
 
-def spectral_spacing(values):
+def spectral_spacing(values, out=None):
     """
     Compute spacing between consecutive spectral values.
     Parameters:
         values (array-like): sequence of spectral values
+        out (np.ndarray): optional preallocated buffer for the result
     Returns:
         np.ndarray: differences between consecutive entries
     """
-    values = np.array(values)
-    return np.diff(values)
+    values = np.asarray(values)
+    return np.subtract(values[..., 1:], values[..., :-1], out=out)
 
 def compare_with_zeta(mu_values, gamma_values):
     """
@@ -63,8 +67,8 @@ def compare_with_zeta(mu_values, gamma_values):
     Returns:
         dict: containing abs_error and rel_error arrays
     """
-    mu_values = np.array(mu_values)
-    gamma_values = np.array(gamma_values)
+    mu_values = np.asarray(mu_values)
+    gamma_values = np.asarray(gamma_values)
     abs_error = np.abs(mu_values - gamma_values)
     rel_error = abs_error / np.abs(gamma_values)
     return {
@@ -81,5 +85,7 @@ def trace_function(lambdas, t):
     Returns:
         float: trace value
     """
-    lambdas = np.array(lambdas)
-    return np.sum(np.exp(t * lambdas))
+    lambdas = np.asarray(lambdas)
+    # Exponentiate in place so only one length-N buffer is allocated
+    values = np.multiply(t, lambdas, dtype=np.result_type(t, lambdas, np.float64))
+    return np.sum(np.exp(values, out=values))
@@ -11,80 +11,142 @@ density overlays, and trace plots.
 import numpy as np
 import matplotlib.pyplot as plt
 
+# --- Figure Helpers ---
+
+def _save_figure(fig, savepath):
+    """
+    Lay out, save and close a figure created by one of the plot functions.
+    """
+    fig.tight_layout()
+    fig.savefig(savepath, dpi=300)
+    plt.close(fig)
+
 # --- Comparison Plot ---
 
-def plot_comparison(mu_values, gamma_values, savepath="comparison_plot.png"):
+def plot_comparison(mu_values, gamma_values, savepath="comparison_plot.png", ax=None):
     """
     Plot normalized spectral values μ_n vs zeta zeros γ_n.
+    If ax is given, the plot is drawn onto it and saving is left to the caller.
     """
-    plt.figure(figsize=(8,5))
-    plt.plot(mu_values, label="Spectral μ_n", marker="o")
-    plt.plot(gamma_values, label="Zeta zeros γ_n", marker="x")
-    plt.xlabel("n")
-    plt.ylabel("Value")
-    plt.title("Comparison: Spectral vs Zeta Zeros")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(savepath, dpi=300)
-    plt.close()
+    created = ax is None
+    if created:
+        fig, ax = plt.subplots(figsize=(8,5))
+    ax.plot(mu_values, label="Spectral μ_n", marker="o")
+    ax.plot(gamma_values, label="Zeta zeros γ_n", marker="x")
+    ax.set_xlabel("n")
+    ax.set_ylabel("Value")
+    ax.set_title("Comparison: Spectral vs Zeta Zeros")
+    ax.legend()
+    ax.grid(True)
+    if created:
+        _save_figure(fig, savepath)
+    return ax
 
 # --- Spacing Plot ---
 
-def plot_spacing(mu_values, gamma_values, savepath="spacing_plot.png"):
+def plot_spacing(mu_values, gamma_values, savepath="spacing_plot.png", ax=None):
     """
     Plot spacing between consecutive μ_n and γ_n.
+    If ax is given, the plot is drawn onto it and saving is left to the caller.
     """
     mu_spacing = np.diff(mu_values)
     gamma_spacing = np.diff(gamma_values)
-    plt.figure(figsize=(8,5))
-    plt.plot(mu_spacing, label="Spectral spacing", marker="o")
-    plt.plot(gamma_spacing, label="Zeta spacing", marker="x")
-    plt.xlabel("n")
-    plt.ylabel("Spacing")
-    plt.title("Spacing Comparison: Spectral vs Zeta Zeros")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(savepath, dpi=300)
-    plt.close()
+    created = ax is None
+    if created:
+        fig, ax = plt.subplots(figsize=(8,5))
+    ax.plot(mu_spacing, label="Spectral spacing", marker="o")
+    ax.plot(gamma_spacing, label="Zeta spacing", marker="x")
+    ax.set_xlabel("n")
+    ax.set_ylabel("Spacing")
+    ax.set_title("Spacing Comparison: Spectral vs Zeta Zeros")
+    ax.legend()
+    ax.grid(True)
+    if created:
+        _save_figure(fig, savepath)
+    return ax
 
 # --- Density Plot ---
 
-def plot_density(mu_values, gamma_values, bins=20, savepath="density_plot.png"):
+def plot_density(mu_values, gamma_values, bins=20, savepath="density_plot.png",
+                 ax=None):
     """
     Overlay histograms of μ_n and γ_n.
+    Both histograms share the same bin edges so the overlay is comparable.
+    If ax is given, the plot is drawn onto it and saving is left to the caller.
     """
-    plt.figure(figsize=(8,5))
-    plt.hist(mu_values, bins=bins, alpha=0.5, label="Spectral μ_n")
-    plt.hist(gamma_values, bins=bins, alpha=0.5, label="Zeta zeros γ_n")
-    plt.xlabel("Value")
-    plt.ylabel("Frequency")
-    plt.title("Density Overlay: Spectral vs Zeta Zeros")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(savepath, dpi=300)
-    plt.close()
+    mu_values = np.asarray(mu_values)
+    gamma_values = np.asarray(gamma_values)
+    # Shared edges from finite values only; hist skips NaNs when binning
+    all_values = np.concatenate([mu_values, gamma_values])
+    edges = np.histogram_bin_edges(all_values[np.isfinite(all_values)], bins=bins)
+    created = ax is None
+    if created:
+        fig, ax = plt.subplots(figsize=(8,5))
+    ax.hist(mu_values, bins=edges, alpha=0.5, label="Spectral μ_n")
+    ax.hist(gamma_values, bins=edges, alpha=0.5, label="Zeta zeros γ_n")
+    ax.set_xlabel("Value")
+    ax.set_ylabel("Frequency")
+    ax.set_title("Density Overlay: Spectral vs Zeta Zeros")
+    ax.legend()
+    ax.grid(True)
+    if created:
+        _save_figure(fig, savepath)
+    return ax
 
 # --- Trace Plot ---
 
-def plot_trace(lambdas, t_values, savepath="trace_plot.png"):
+# Smallest (t, λ) grid worth sending to the GPU; below this the transfer dominates
+GPU_MIN_GRID_SIZE = 1_000_000
+
+# Target size of one exp(t * λ) tile, chosen to stay within a typical L2 cache
+TRACE_TILE_BYTES = 256 * 1024
+
+def plot_trace(lambdas, t_values, savepath="trace_plot.png", block_size=None,
+               dtype=np.float32, device="cpu", ax=None):
     """
     Plot trace function Tr(f(T)) = sum exp(t * λ_n).
+    The exp(t * λ_n) grid is evaluated in blocks of block_size t-values
+    so each block stays cache-resident; by default the block size is
+    derived from TRACE_TILE_BYTES and the number of eigenvalues.
+    Single precision is enough for plotting; pass dtype=np.float64 for
+    full precision. Grids whose exponents would overflow float32 are
+    evaluated in float64 automatically.
+    With device="gpu", grids larger than GPU_MIN_GRID_SIZE are evaluated
+    with CuPy (imported only then); only the reduced traces are copied back.
+    If ax is given, the plot is drawn onto it and saving is left to the caller.
     """
-    traces = []
-    for t in t_values:
-        traces.append(np.sum(np.exp(t * np.array(lambdas))))
-    plt.figure(figsize=(8,5))
-    plt.plot(t_values, traces, marker="o")
-    plt.xlabel("t")
-    plt.ylabel("Trace value")
-    plt.title("Trace Function Plot")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(savepath, dpi=300)
-    plt.close()
+    lambdas = np.asarray(lambdas, dtype=np.float64)
+    t_values = np.asarray(t_values, dtype=np.float64)
+    dtype = np.dtype(dtype)
+    if dtype == np.float32 and lambdas.size and t_values.size:
+        # Largest exponent for which the sum of λ.size terms stays finite
+        limit = np.log(np.finfo(np.float32).max / lambdas.size)
+        if np.abs(t_values).max() * np.abs(lambdas).max() > limit:
+            dtype = np.dtype(np.float64)
+    lambdas = lambdas.astype(dtype, copy=False)
+    t_values = t_values.astype(dtype, copy=False)
+    if block_size is None:
+        block_size = max(1, TRACE_TILE_BYTES // max(1, lambdas.size * dtype.itemsize))
+    if device == "gpu" and t_values.size * lambdas.size > GPU_MIN_GRID_SIZE:
+        import cupy as cp
+        grid = cp.outer(cp.asarray(t_values), cp.asarray(lambdas))
+        traces = cp.exp(grid).sum(axis=1).get()
+    else:
+        traces = np.empty(t_values.size, dtype=dtype)
+        for start in range(0, t_values.size, block_size):
+            t_block = t_values[start:start + block_size]
+            traces[start:start + block_size] = np.exp(np.outer(t_block, lambdas)).sum(axis=1)
+    created = ax is None
+    if created:
+        fig, ax = plt.subplots(figsize=(8,5))
+    ax.plot(t_values, traces, marker="o")
+    ax.set_xlabel("t")
+    ax.set_ylabel("Trace value")
+    ax.set_title("Trace Function Plot")
+    ax.grid(True)
+    if created:
+        _save_figure(fig, savepath)
+    return ax
 
 # --- Example Usage ---
 
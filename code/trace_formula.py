@@ -17,7 +17,9 @@ def trace_formula(f, zeta_zeros, trivial_zeros=None, archimedean_term=None):
         Tr(f(T)) = sum_{rho} f(rho) - f(1) + sum_{m>=1} f(-2m) + A(f)
 
     Parameters:
-        f (callable): test function, e.g. lambda s: np.exp(-s**2)
+        f (callable): test function, e.g. lambda s: np.exp(-s**2);
+            a vectorized f is evaluated once on the whole array of zeros,
+            other callables fall back to element-wise evaluation
         zeta_zeros (array-like): nontrivial zeros γ_n
         trivial_zeros (array-like): optional list of trivial zeros (-2m)
         archimedean_term (callable): optional archimedean contribution A(f)
@@ -26,7 +28,7 @@ def trace_formula(f, zeta_zeros, trivial_zeros=None, archimedean_term=None):
         float: trace formula value
     """
     # Nontrivial zeros contribution
-    rho_sum = np.sum([f(rho) for rho in zeta_zeros])
+    rho_sum = np.sum(_evaluate(f, zeta_zeros))
 
     # Pole at s=1
     pole_term = -f(1)
@@ -34,7 +36,7 @@ def trace_formula(f, zeta_zeros, trivial_zeros=None, archimedean_term=None):
     # Trivial zeros contribution
     trivial_sum = 0.0
     if trivial_zeros is not None:
-        trivial_sum = np.sum([f(tz) for tz in trivial_zeros])
+        trivial_sum = np.sum(_evaluate(f, trivial_zeros))
 
     # Archimedean contribution
     arch_term = 0.0
@@ -46,19 +48,48 @@ def trace_formula(f, zeta_zeros, trivial_zeros=None, archimedean_term=None):
 
 # --- Helper Functions ---
 
+# Integration grid x and weights exp(-x) for archimedean_contribution, keyed on samples
+_arch_cache = {}
+
+def _evaluate(f, values):
+    """
+    Evaluate f on an array of points.
+    A vectorized f is called once on the whole array; if f only handles
+    scalars, it is applied element-wise through np.frompyfunc.
+    """
+    values = np.asarray(values)
+    try:
+        result = f(values)
+        if np.shape(result) == values.shape:
+            return result
+    except (TypeError, ValueError):
+        pass
+    # Let NumPy infer the result dtype so complex values of f are kept
+    return np.array(np.frompyfunc(f, 1, 1)(values).tolist())
+
 def generate_trivial_zeros(M=10):
     """
     Generate first M trivial zeros of zeta: -2, -4, -6, ...
+    Returned as a float64 array so it can be passed straight to f.
     """
-    return [-2*m for m in range(1, M+1)]
+    return -2.0 * np.arange(1, M+1, dtype=np.float64)
 
 def archimedean_contribution(f, samples=1000):
     """
     Approximate archimedean contribution A(f) via numerical integration.
     For demonstration, we use a Gaussian weight.
+    A vectorized f is the fast path (see _evaluate). The grid and weights
+    only depend on samples and are computed once per value.
     """
-    x = np.linspace(0.1, 10, samples)
-    return np.trapz([f(val) * np.exp(-val) for val in x], x)
+    grid = _arch_cache.get(samples)
+    if grid is None:
+        x = np.linspace(0.1, 10, samples)
+        weights = np.exp(-x)
+        x.flags.writeable = False
+        weights.flags.writeable = False
+        grid = _arch_cache[samples] = (x, weights)
+    x, weights = grid
+    return np.trapz(_evaluate(f, x) * weights, x)
 
 
 # --- Example Usage ---
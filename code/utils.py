@@ -8,6 +8,7 @@ CSV export, and reproducibility in spectral/zeta analysis.
 """
 
 import numpy as np
+import atexit
 import csv
 import os
 
@@ -23,8 +24,11 @@ def normalize(array):
     Returns:
         np.ndarray: normalized values
     """
-    arr = np.array(array, dtype=float)
-    return (arr - np.mean(arr)) / np.std(arr)
+    arr = np.asarray(array, dtype=float)
+    # Center into a single output buffer, then take the variance from it
+    out = np.subtract(arr, arr.mean())
+    out /= np.sqrt(np.vdot(out, out) / out.size)
+    return out
 
 def scale(array, factor=1.0, shift=0.0):
     """
@@ -38,30 +42,42 @@ def scale(array, factor=1.0, shift=0.0):
     Returns:
         np.ndarray: transformed values
     """
-    arr = np.array(array, dtype=float)
+    arr = np.asarray(array, dtype=float)
     return factor * arr + shift
 
 # --- CSV Export Utilities ---
 
-def export_csv(filename, headers, rows, folder="output/data"):
+def export_csv(filename, headers, rows, folder="output/data", fmt=None):
     """
     Export data to CSV file.
     
+    A 2-D integer or float ndarray is written with np.savetxt, producing
+    the same text as the csv module; all other rows go through csv.writer.
+    
     Parameters:
         filename (str): name of CSV file
         headers (list): list of column names
-        rows (list of lists): data rows
+        rows (list of lists or np.ndarray): data rows
         folder (str): target folder
+        fmt (str): optional number format for ndarray rows
     
     Returns:
         str: full path of saved file
     """
     os.makedirs(folder, exist_ok=True)
     filepath = os.path.join(folder, filename)
+    numeric = (isinstance(rows, np.ndarray) and rows.ndim == 2
+               and (np.issubdtype(rows.dtype, np.integer)
+                    or np.issubdtype(rows.dtype, np.floating)))
     with open(filepath, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(headers)
-        writer.writerows(rows)
+        if numeric:
+            if fmt is None:
+                fmt = "%d" if np.issubdtype(rows.dtype, np.integer) else "%s"
+            np.savetxt(f, rows, fmt=fmt, delimiter=",", newline="\r\n")
+        else:
+            writer.writerows(rows)
     return filepath
 
 # --- Error Metrics ---
@@ -70,31 +86,55 @@ def mean_absolute_error(approx, exact):
     """
     Compute mean absolute error (MAE).
     """
-    approx = np.array(approx, dtype=float)
-    exact = np.array(exact, dtype=float)
-    return np.mean(np.abs(approx - exact))
+    approx = np.asarray(approx, dtype=float)
+    exact = np.asarray(exact, dtype=float)
+    # Work in a single error buffer instead of one temporary per operation
+    err = np.subtract(approx, exact)
+    np.abs(err, out=err)
+    return err.mean()
 
 def mean_relative_error(approx, exact):
     """
     Compute mean relative error (MRE).
+    Entries where the exact value is zero contribute 0.
     """
-    approx = np.array(approx, dtype=float)
-    exact = np.array(exact, dtype=float)
-    return np.mean(np.abs(approx - exact) / np.abs(exact))
+    approx = np.asarray(approx, dtype=float)
+    exact = np.asarray(exact, dtype=float)
+    nonzero = exact != 0
+    # |approx - exact| / |exact| == |(approx - exact) / exact|, computed in place
+    err = np.subtract(approx, exact)
+    np.divide(err, exact, out=err, where=nonzero)
+    np.abs(err, out=err)
+    return np.sum(err, where=nonzero) / err.size
 
 # --- Logging Utilities ---
 
+# Open append handles per log file, reused across log_message calls
+_log_handles = {}
+
+def _close_log_handles():
+    for handle in _log_handles.values():
+        handle.close()
+    _log_handles.clear()
+
+atexit.register(_close_log_handles)
+
 def log_message(message, logfile="output/logs/run.log"):
     """
     Append a message to a log file.
     
+    The file is opened once and kept as a line-buffered handle, so each
+    message reaches the file as soon as it is written.
+    
     Parameters:
         message (str): log message
         logfile (str): path to log file
     """
-    os.makedirs(os.path.dirname(logfile), exist_ok=True)
-    with open(logfile, "a", encoding="utf-8") as f:
-        f.write(message + "\n")
+    handle = _log_handles.get(logfile)
+    if handle is None:
+        os.makedirs(os.path.dirname(logfile), exist_ok=True)
+        handle = _log_handles[logfile] = open(logfile, "a", encoding="utf-8", buffering=1)
+    handle.write(message + "\n")
 
 # --- Example Usage ---
 